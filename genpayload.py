@@ -1,5 +1,14 @@
+import bisect
+import contextlib
+import functools
+import heapq
+import mmap
 import os
 import shutil
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from git import Repo, GitCommandError, RemoteProgress
 from rich.console import Console
@@ -9,30 +18,79 @@ from rich.panel import Panel
 from rich import box
 from rich.progress import Progress, BarColumn, TextColumn, TimeElapsedColumn, TimeRemainingColumn
 from prompt_toolkit import prompt
-from prompt_toolkit.completion import PathCompleter
+from prompt_toolkit.completion import Completer, Completion, PathCompleter
 
 console = Console()
 LOCAL_REPO_DIR = Path.cwd() / "SecLists"
 MERGED_FILE = LOCAL_REPO_DIR / "merged_list.txt"
+# written first and swapped into place; hidden from browsing in case a run is killed midway
+MERGED_TMP_FILE = MERGED_FILE.with_suffix(".tmp")
 GIT_REPO_URL = "https://github.com/danielmiessler/SecLists.git"
+GIT_BRANCH = "master"
+# SecLists is consumed as a snapshot: skip history and tags, fetch blobs on demand
+SHALLOW_CLONE_OPTIONS = [
+    "--filter=blob:none",
+    "--depth=1",
+    "--no-tags",
+    "--single-branch",
+    f"--branch={GIT_BRANCH}",
+]
+# kept under .git so the browser, completion index and work tree never see it
+LAST_HEAD_FILE = LOCAL_REPO_DIR / ".git" / "genpayload_last_head"
+HEAD_CHECK_INTERVAL = 600  # seconds to trust the cached remote HEAD
+PROGRESS_INTERVAL = 0.1  # seconds between progress bar refreshes
+IO_BUFFER_SIZE = 1 << 20
+WRITE_CHUNK_SIZE = 1 << 20
+COPY_CHUNK_SIZE = 1 << 24
+MAX_TABLE_ROWS = 200
+MAX_READ_WORKERS = 8
+RUN_LINES = 500_000  # lines a reader keeps in memory before spilling a sorted run to disk
 
 class RichGitProgress(RemoteProgress):
     def __init__(self, progress, task_id):
         super().__init__()
         self.progress = progress
         self.task_id = task_id
+        self._last = 0.0
 
     def update(self, op_code, cur_count, max_count=None, message=''):
+        # git reports every object; re-rendering that often steals CPU from the clone
+        now = time.monotonic()
+        if not op_code & self.END and now - self._last < PROGRESS_INTERVAL:
+            return
+        self._last = now
         if max_count:
             self.progress.update(self.task_id, total=max_count, completed=cur_count, description=message or "Cloning...")
         else:
             self.progress.update(self.task_id, description=message or "Cloning...")
 
+def remember_head(sha):
+    try:
+        LAST_HEAD_FILE.write_text(sha)
+    except OSError:
+        pass
+
+def is_up_to_date(repo):
+    local_sha = repo.head.commit.hexsha
+    try:
+        if time.time() - LAST_HEAD_FILE.stat().st_mtime < HEAD_CHECK_INTERVAL:
+            return LAST_HEAD_FILE.read_text().strip() == local_sha
+    except OSError:
+        pass
+    refs = repo.git.ls_remote("origin", f"refs/heads/{GIT_BRANCH}").split()
+    if not refs:
+        return False
+    remember_head(refs[0])
+    return refs[0] == local_sha
+
 def clone_or_update_repo():
     if LOCAL_REPO_DIR.exists():
-        console.print("[yellow]SecLists repo already cloned. Pulling latest changes...[/yellow]")
+        console.print("[yellow]SecLists repo already cloned. Checking for updates...[/yellow]")
         try:
             repo = Repo(LOCAL_REPO_DIR)
+            if is_up_to_date(repo):
+                console.print("[green]Repo is up to date[/green]")
+                return
             origin = repo.remotes.origin
             with Progress(
                 TextColumn("[progress.description]{task.description}"),
@@ -43,10 +101,19 @@ def clone_or_update_repo():
             ) as progress:
                 task = progress.add_task("Pulling latest changes...", start=False)
                 progress.start_task(task)
-                origin.pull(progress=RichGitProgress(progress, task))
+                origin.fetch(
+                    GIT_BRANCH,
+                    progress=RichGitProgress(progress, task),
+                    depth=1,
+                    filter="blob:none",
+                    no_tags=True,
+                )
+                repo.git.reset("--hard", "FETCH_HEAD")
+            remember_head(repo.head.commit.hexsha)
+            wordlist_index.cache_clear()
             console.print("[green]Repo updated successfully[/green]")
         except GitCommandError as e:
-            console.print(f"[red]Git pull failed: {e}[/red]")
+            console.print(f"[red]Git update failed: {e}[/red]")
     else:
         console.print("[green]Cloning SecLists repo...[/green]")
         try:
@@ -59,24 +126,45 @@ def clone_or_update_repo():
             ) as progress:
                 task = progress.add_task("Cloning repo...", start=False)
                 progress.start_task(task)
-                Repo.clone_from(GIT_REPO_URL, LOCAL_REPO_DIR, progress=RichGitProgress(progress, task))
+                Repo.clone_from(
+                    GIT_REPO_URL,
+                    LOCAL_REPO_DIR,
+                    multi_options=SHALLOW_CLONE_OPTIONS,
+                    progress=RichGitProgress(progress, task),
+                )
             console.print("[green]Repo cloned successfully[/green]")
         except GitCommandError as e:
             console.print(f"[red]Git clone failed: {e}[/red]")
 
-def list_dir(path: Path):
+@functools.lru_cache(maxsize=64)
+def scan_dir(path_str, mtime_ns):
+    # mtime_ns is only part of the cache key: adding or removing entries bumps it
     entries = []
-    try:
-        for entry in sorted(path.iterdir()):
+    # DirEntry caches the d_type from getdents, so is_dir/is_file need no extra stat
+    with os.scandir(path_str) as it:
+        for entry in sorted(it, key=lambda e: e.name):
+            if entry.path == str(MERGED_TMP_FILE):
+                continue
             if entry.is_dir():
-                entries.append({"name": entry.name, "type": "dir", "path": entry})
+                entries.append({"name": entry.name, "type": "dir", "path": Path(entry.path)})
             elif entry.is_file():
-                entries.append({"name": entry.name, "type": "file", "path": entry})
+                entries.append({"name": entry.name, "type": "file", "path": Path(entry.path)})
+    return tuple(entries)
+
+def list_dir(path: Path):
+    try:
+        return scan_dir(str(path), path.stat().st_mtime_ns)
     except Exception as e:
         console.print(f"[red]Failed to list directory: {e}[/red]")
-    return entries
+        return ()
 
 def print_table(items, title):
+    if len(items) > MAX_TABLE_ROWS:
+        # laying out a rich Table for thousands of rows takes seconds, so print plain columns
+        console.print(f"[bold]{title}[/bold]")
+        rows = "\n".join(f"{i:>5} {item['type'][0]} {item['name']}" for i, item in enumerate(items, 1))
+        console.print(rows, markup=False, highlight=False)
+        return
     table = Table(title=title, box=box.HEAVY_EDGE, show_lines=True)
     table.add_column("Index", justify="center", style="cyan")
     table.add_column("Name", style="bold white")
@@ -96,15 +184,91 @@ def select_items(items):
         console.print("[red]Invalid input[/red]")
         return []
 
+@functools.lru_cache(maxsize=1)
+def wordlist_index():
+    # walked once per session so tab completion inside SecLists never hits the disk
+    paths = []
+    for root, dirs, files in os.walk(LOCAL_REPO_DIR):
+        dirs[:] = [d for d in dirs if d != ".git"]
+        paths.extend(os.path.join(root, name) for name in files)
+    if str(MERGED_TMP_FILE) in paths:
+        paths.remove(str(MERGED_TMP_FILE))
+    paths.sort()
+    return paths
+
+class WordlistCompleter(Completer):
+    # paths under SecLists are prefix-matched in the sorted index; anything else goes to disk
+    def __init__(self):
+        self.index = wordlist_index()
+        self.path_completer = PathCompleter()
+
+    def get_completions(self, document, complete_event):
+        text = document.text_before_cursor
+        full = os.path.join(os.getcwd(), text)
+        if not text or not full.startswith(str(LOCAL_REPO_DIR) + os.sep):
+            yield from self.path_completer.get_completions(document, complete_event)
+            return
+        # like PathCompleter, offer one path component at a time
+        partial = os.path.basename(full)
+        i = bisect.bisect_left(self.index, full)
+        while i < len(self.index) and self.index[i].startswith(full):
+            rest = self.index[i][len(full):]
+            sep = rest.find(os.sep)
+            if sep == -1:
+                yield Completion(rest, start_position=0, display=partial + rest)
+                i += 1
+                continue
+            component = rest[:sep + 1]
+            yield Completion(component, start_position=0, display=partial + component)
+            # skip the rest of this directory: its paths sort before "<dir>" + chr(ord(sep) + 1)
+            i = bisect.bisect_left(self.index, full + rest[:sep] + chr(ord(os.sep) + 1), i)
+
+@contextlib.contextmanager
+def atomic_output(path, size_hint=0):
+    # write next to the target and swap it in, so a crash never leaves a half-written list
+    tmp = path.with_suffix(".tmp")
+    try:
+        with tmp.open("wb", buffering=IO_BUFFER_SIZE) as out_file:
+            if size_hint and hasattr(os, "posix_fallocate"):
+                try:
+                    os.posix_fallocate(out_file.fileno(), 0, size_hint)
+                except OSError:
+                    pass
+            yield out_file
+            out_file.flush()
+            # the hint is only an upper bound, so cut the preallocated tail off
+            os.ftruncate(out_file.fileno(), os.lseek(out_file.fileno(), 0, os.SEEK_CUR))
+            os.fsync(out_file.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+def copy_file(src, out_file):
+    with src.open("rb") as s:
+        # copy_file_range keeps the data in the kernel; fall back where it is missing or unsupported
+        if hasattr(os, "copy_file_range"):
+            try:
+                while os.copy_file_range(s.fileno(), out_file.fileno(), COPY_CHUNK_SIZE):
+                    pass
+                shutil.copymode(src, out_file.name)
+                return
+            except OSError:
+                s.seek(0)
+                out_file.seek(0)
+        shutil.copyfileobj(s, out_file, COPY_CHUNK_SIZE)
+    shutil.copymode(src, out_file.name)
+
 def upload_custom_wordlist():
     console.print("[bold]Enter the full path to your local wordlist file:[/bold]")
-    path = prompt("> ", completer=PathCompleter())
+    path = prompt("> ", completer=WordlistCompleter())
     p = Path(path)
     if not p.is_file():
         console.print("[red]File not found.[/red]")
         return
     try:
-        shutil.copy(p, MERGED_FILE)
+        with atomic_output(MERGED_FILE, p.stat().st_size) as out_file:
+            copy_file(p, out_file)
         console.print(f"[green]Copied your file to:[/green] {MERGED_FILE}")
     except Exception as e:
         console.print(f"[red]Failed to copy file: {e}[/red]")
@@ -133,6 +297,152 @@ def browse_and_select_files(base_path):
         else:
             return selected_files
 
+def sort_unique(paths, out_file, strip=True):
+    # LC_ALL=C compares raw bytes, which is both faster and stable across locales
+    with subprocess.Popen(
+        ["sort", "-u", "-S", "1G", "--parallel=4"],
+        stdin=subprocess.PIPE,
+        stdout=out_file,
+        env={**os.environ, "LC_ALL": "C"},
+        bufsize=IO_BUFFER_SIZE,
+    ) as proc:
+        # feed sort the same lines the other merge paths see
+        for path in paths:
+            for block in iter_line_blocks(path, strip):
+                write_lines(proc.stdin, block)
+        proc.stdin.close()
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, proc.args)
+
+def iter_line_blocks(path, strip=True):
+    # map the file instead of reading it so blocks are sliced straight from the page cache
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            start = 0
+            while start < size:
+                # cut each ~1 MiB block just after a newline so no line is split
+                stop = mm.find(b"\n", start + IO_BUFFER_SIZE)
+                stop = size if stop == -1 else stop + 1
+                block = mm[start:stop]
+                start = stop
+                # split/strip/filter all run in C instead of once per line in Python
+                if strip:
+                    yield list(filter(None, map(bytes.strip, block.split(b"\n"))))
+                    continue
+                # otherwise keep payloads exactly as written, minus the line terminator
+                lines = block.replace(b"\r\n", b"\n").split(b"\n")
+                if block.endswith(b"\n"):
+                    lines.pop()
+                yield lines
+
+def iter_lines(path, strip=True):
+    for block in iter_line_blocks(path, strip):
+        yield from block
+
+def write_lines(out_file, lines):
+    # join lines into ~1 MiB chunks so neither a whole list nor one write per line is needed
+    chunk = []
+    size = 0
+    for line in lines:
+        chunk.append(line)
+        size += len(line) + 1
+        if size >= WRITE_CHUNK_SIZE:
+            chunk.append(b"")
+            out_file.write(b"\n".join(chunk))
+            chunk.clear()
+            size = 0
+    if chunk:
+        chunk.append(b"")
+        out_file.write(b"\n".join(chunk))
+
+def write_run(lines):
+    # sort in place and drop duplicates while writing, so no hash set is needed
+    lines.sort()
+    # keep runs on the same disk as the output; /tmp is often RAM-backed tmpfs
+    run = tempfile.TemporaryFile(dir=MERGED_FILE.parent)
+    write_lines(run, unique(lines))
+    run.seek(0)
+    return run
+
+def spill_runs(path, strip=True):
+    # bound memory by flushing sorted runs to temp files, like an external sort would
+    runs = []
+    lines = []
+    for block in iter_line_blocks(path, strip):
+        lines.extend(block)
+        if len(lines) >= RUN_LINES:
+            runs.append(write_run(lines))
+            lines = []
+    if lines:
+        runs.append(write_run(lines))
+    return runs
+
+def iter_run(run):
+    for line in run:
+        yield line[:-1]
+
+def is_sorted(path, strip=True):
+    prev = b""
+    for line in iter_lines(path, strip):
+        if line < prev:
+            return False
+        prev = line
+    return True
+
+def unique(sorted_lines):
+    prev = None
+    for line in sorted_lines:
+        if line != prev:
+            yield line
+            prev = line
+
+def prefetch(paths):
+    # start readahead on every input at once instead of warming each file in turn
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+def merge_wordlists(paths, out_path=MERGED_FILE, strip=True):
+    prefetch(paths)
+    # every line is written with a newline, so each input can grow by one byte at most
+    size_hint = sum(os.path.getsize(f) for f in paths) + len(paths)
+    with atomic_output(out_path, size_hint) as out_file:
+        if shutil.which("sort"):
+            try:
+                sort_unique(paths, out_file, strip)
+                return
+            except (OSError, subprocess.CalledProcessError) as e:
+                console.print(f"[yellow]External sort failed ({e}), falling back to the built-in merge[/yellow]")
+                out_file.seek(0)
+        # wordlists are byte-oriented, so never decode them
+        if all(is_sorted(f, strip) for f in paths):
+            # every input is already in byte order, so a streaming k-way merge is enough
+            write_lines(out_file, unique(heapq.merge(*(iter_lines(f, strip) for f in paths))))
+            return
+        with ThreadPoolExecutor(max_workers=min(MAX_READ_WORKERS, len(paths))) as pool:
+            read = functools.partial(spill_runs, strip=strip)
+            runs = [run for file_runs in pool.map(read, paths) for run in file_runs]
+        try:
+            write_lines(out_file, unique(heapq.merge(*map(iter_run, runs))))
+        finally:
+            for run in runs:
+                run.close()
+
 def merge_files_interactive(base_path):
     console.print("[bold]Select the first wordlist file to merge:[/bold]")
     first_files = browse_and_select_files(base_path)
@@ -147,11 +457,8 @@ def merge_files_interactive(base_path):
     p1 = first_files[0]
     p2 = second_files[0]
     try:
-        with p1.open("r", encoding="utf-8", errors="ignore") as file1, \
-             p2.open("r", encoding="utf-8", errors="ignore") as file2:
-            lines = set(file1.read().splitlines() + file2.read().splitlines())
-        with MERGED_FILE.open("w", encoding="utf-8") as out_file:
-            out_file.write("\n".join(sorted(lines)))
+        # unlike option 1, keep whitespace and blank lines: they can be part of a payload
+        merge_wordlists([p1, p2], strip=False)
         console.print(f"[green]Merged files saved as:[/green] {MERGED_FILE}")
     except Exception as e:
         console.print(f"[red]Failed to merge files: {e}[/red]")
@@ -174,12 +481,7 @@ def main():
                 console.print("[yellow]No files selected.[/yellow]")
                 continue
             try:
-                merged_lines = set()
-                for f in files:
-                    with open(f, "r", encoding="utf-8", errors="ignore") as file:
-                        merged_lines.update(line.strip() for line in file if line.strip())
-                with MERGED_FILE.open("w", encoding="utf-8") as out_file:
-                    out_file.write("\n".join(sorted(merged_lines)))
+                merge_wordlists(files)
                 console.print(f"[green]Selected files merged and saved as:[/green] {MERGED_FILE}")
             except Exception as e:
                 console.print(f"[red]Failed to merge selected files: {e}[/red]")